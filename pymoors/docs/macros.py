@@ -1,3 +1,6 @@
+import functools
+
+
 def define_env(env):
     """
     Defines a macro `docs_rs(item_type, item_name)` that returns
@@ -7,6 +10,7 @@ def define_env(env):
     base = f"https://docs.rs/moors/{version}/moors/"
 
     @env.macro
+    @functools.lru_cache(maxsize=4096)
     def docs_rs(
         item_type: str,
         path: str,
@@ -14,19 +18,15 @@ def define_env(env):
         method: str | None = None,
         tymethod: str | None = None,
     ) -> str:
-        parts = path.split(".")
-        name, *rest = parts[::-1]
+        *head, name = path.split(".")
         # reconstruct the URL path
-        if rest:
-            parts_url = "/".join(parts[:-1]) + f"/{item_type}.{name}.html"
-        else:
-            parts_url = f"{item_type}.{name}.html"
+        parts_url = "".join(f"{part}/" for part in head) + f"{item_type}.{name}.html"
         url = base + parts_url
         if method:
             url = url + f"#method.{method}"
 
         if tymethod:
-            url = url + f"#tymethod.{method}"
+            url = url + f"#tymethod.{tymethod}"
 
         text = label or name
         # return raw HTML
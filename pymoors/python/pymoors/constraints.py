@@ -10,6 +10,16 @@ ConstraintSpec: TypeAlias = (
     | None
 )
 
+# Number of gene values handled per tile when writing both bound blocks
+# (256 KiB of float64, small enough to stay in L2 between the two passes).
+_BOUNDS_TILE_ELEMENTS = 32_768
+
+
+def _as_python_scalar(value: float | None) -> float | None:
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
 
 class Constraints:
     """
@@ -26,10 +36,21 @@ class Constraints:
       3) Lower-bound violations: (lower_bound - genes), if provided (shape: (n, d)).
       4) Upper-bound violations: (genes - upper_bound), if provided (shape: (n, d)).
 
+    Inside the algorithms the bound violations are computed in Rust; only the `eq` and
+    `ineq` callables are evaluated in Python. Calling the instance directly evaluates
+    everything in Python with the same output.
+
     The resulting matrix has shape (n, m), where:
       m = (cols from ε-adapted `eq`) + (cols from `ineq`)
           + d * I[lower_bound is not None] + d * I[upper_bound is not None]
 
+    A callable that sets the attribute `_out_kwarg = True` is called as
+    `fn(genes, out=block)` from its second call on, writing its result straight into
+    the (n, k) slice of the output instead of returning a new array. Its first call
+    for each genes width `d` and dtype is a regular `fn(genes)` used to learn `k`
+    and the output dtype, so it must accept both forms. A callable whose regular
+    output is 1D is given the (n,) column `block[:, 0]` instead.
+
     Parameters
     ----------
     eq : Callable[[TwoDArray], OneDArray | TwoDArray]
@@ -44,13 +65,17 @@ class Constraints:
         Scalar lower bound applied element-wise; violations are (lower_bound - genes).
     upper_bound : float, optional
         Scalar upper bound applied element-wise; violations are (genes - upper_bound).
+        Bound violations keep the dtype of `genes` (e.g. float32 genes give float32
+        violations) unless the bound is not representable in it, like a fractional
+        bound on integer genes.
     epsilon : float, optional (default: 1e-6)
         Tolerance for equality constraints. Must be non-negative.
 
     Returns
     -------
     TwoDArray
-        Constraint evaluation matrix of shape (n, m), as described above.
+        Constraint evaluation matrix of shape (n, m), as described above. Each call
+        returns a newly allocated array.
 
     Raises
     ------
@@ -101,10 +126,25 @@ class Constraints:
                 "At least one of `eq`, `ineq`, `lower_bound`, or `upper_bound` must be provided."
             )
 
-        self.lower_bound = lower_bound
-        self.upper_bound = upper_bound
+        # NumPy scalars are unwrapped to Python scalars so they do not widen the
+        # genes dtype (e.g. a np.float64 bound on float32 genes).
+        self.lower_bound = _as_python_scalar(lower_bound)
+        self.upper_bound = _as_python_scalar(upper_bound)
         self.epsilon = float(epsilon)
 
+        # Which blocks make up the output is fixed at construction time, so the
+        # call path is chosen once here instead of being re-checked per call.
+        self._impl: Callable[[TwoDArray], TwoDArray] = (
+            self._call_general if self.eq or self.ineq else self._call_bounds
+        )
+        self._buffer: np.ndarray | None = None
+        # (width, dtype, ndim) of each eq/ineq callable output, learnt on the first
+        # call for each (n_genes, genes dtype) since all may depend on the input
+        self._callables: list[Callable[..., np.ndarray]] = [*self.eq, *self.ineq]
+        self._layouts: list[dict[tuple[int, np.dtype], tuple[int, np.dtype, int]]] = [
+            {} for _ in self._callables
+        ]
+
     def _normalize_output(self, arr: np.ndarray, n_rows: int) -> np.ndarray:
         """Ensure constraint output is 2D with shape (n_rows, k)."""
         arr = np.asarray(arr)
@@ -124,27 +164,132 @@ class Constraints:
             f"Constraint function returned array with ndim={arr.ndim}; only 1D or 2D supported."
         )
 
-    def __call__(self, genes: TwoDArray) -> TwoDArray:
-        n_rows = genes.shape[0]
-        parts: list[np.ndarray] = []
+    def _get_buffer(
+        self, shape: tuple[int, int], dtype: np.dtype, reuse: bool = False
+    ) -> np.ndarray:
+        """
+        Return an output array of the given shape and dtype.
+
+        With `reuse=True` the cached buffer is returned, reallocating it only when shape
+        or dtype change. Only internal callers whose result is copied straight away may
+        reuse it; `__call__` always gets a fresh array.
+        """
+        if not reuse:
+            return np.empty(shape, dtype=dtype)
+        if (
+            self._buffer is None
+            or self._buffer.shape != shape
+            or self._buffer.dtype != dtype
+        ):
+            self._buffer = np.empty(shape, dtype=dtype)
+        return self._buffer
+
+    def _bounds_dtypes(self, genes: TwoDArray) -> list[np.dtype]:
+        return [
+            np.result_type(bound, genes)
+            for bound in (self.lower_bound, self.upper_bound)
+            if bound is not None
+        ]
+
+    def _write_bounds(self, genes: TwoDArray, out: np.ndarray, start: int) -> None:
+        n_rows, n_genes = genes.shape
+        lower = out[:, start : start + n_genes]
+        if self.lower_bound is not None and self.upper_bound is not None:
+            upper = out[:, start + n_genes : start + 2 * n_genes]
+            # Compute both violations tile by tile so each block of genes is
+            # still cache-resident when it is read for the second time.
+            tile = max(1, _BOUNDS_TILE_ELEMENTS // max(n_genes, 1))
+            for row in range(0, n_rows, tile):
+                rows = slice(row, row + tile)
+                np.subtract(self.lower_bound, genes[rows], out=lower[rows])
+                np.subtract(genes[rows], self.upper_bound, out=upper[rows])
+        elif self.lower_bound is not None:
+            np.subtract(self.lower_bound, genes, out=lower)
+        elif self.upper_bound is not None:
+            np.subtract(genes, self.upper_bound, out=lower)
 
-        # 1) Equality residuals -> ε-inequalities: |h(x)| - epsilon
-        for fn in self.eq:
-            raw = fn(genes)
-            norm = self._normalize_output(raw, n_rows)
-            parts.append(np.abs(norm) - self.epsilon)
+    def _call_bounds(self, genes: TwoDArray) -> TwoDArray:
+        n_rows, n_genes = genes.shape
+        dtypes = self._bounds_dtypes(genes)
+        out = self._get_buffer((n_rows, len(dtypes) * n_genes), np.result_type(*dtypes))
+        self._write_bounds(genes, out, 0)
+        return out
 
-        # 2) Inequalities as-is
-        for fn in self.ineq:
-            out = fn(genes)
-            parts.append(self._normalize_output(out, n_rows))
+    def _evaluate(
+        self, index: int, fn: Callable[..., np.ndarray], genes: TwoDArray
+    ) -> tuple[np.ndarray | None, int, np.dtype, int]:
+        """
+        Evaluate a constraint callable and return `(part, width, dtype, ndim)`.
+
+        `ndim` is the dimensionality of the callable's own output, before `part` is
+        reshaped to 2D.
+
+        Callables flagged with `_out_kwarg = True` are evaluated normally the first time
+        they see a given genes width and dtype to learn their output layout; afterwards
+        `part` is `None` and they are called with `out=` once the output buffer exists.
+        """
+        key = (genes.shape[1], genes.dtype)
+        layout = self._layouts[index].get(key)
+        if layout is not None and getattr(fn, "_out_kwarg", False):
+            return None, *layout
+        raw = np.asarray(fn(genes))
+        part = self._normalize_output(raw, genes.shape[0])
+        self._layouts[index][key] = (part.shape[1], part.dtype, raw.ndim)
+        return part, part.shape[1], part.dtype, raw.ndim
+
+    def _call_general(self, genes: TwoDArray, internal: bool = False) -> TwoDArray:
+        n_rows, n_genes = genes.shape
+        n_eq = len(self.eq)
+        results = [
+            self._evaluate(index, fn, genes) for index, fn in enumerate(self._callables)
+        ]
+
+        # Output layout is known before writing anything: fill each block in
+        # place instead of concatenating temporaries.
+        # Internal calls only need the eq/ineq blocks and may reuse the buffer
+        bounds_dtypes = [] if internal else self._bounds_dtypes(genes)
+        n_cols = sum(width for _, width, _, _ in results)
+        n_cols += len(bounds_dtypes) * n_genes
+        dtypes = [
+            np.result_type(dtype, self.epsilon) for _, _, dtype, _ in results[:n_eq]
+        ]
+        dtypes += [dtype for _, _, dtype, _ in results[n_eq:]]
+        out = self._get_buffer(
+            (n_rows, n_cols), np.result_type(*dtypes, *bounds_dtypes), reuse=internal
+        )
+
+        start = 0
+        for index, (fn, (part, width, _, ndim)) in enumerate(
+            zip(self._callables, results)
+        ):
+            block = out[:, start : start + width]
+            if part is None:
+                fn(genes, out=block[:, 0] if ndim == 1 else block)
+            if index < n_eq:
+                # 1) Equality residuals -> ε-inequalities: |h(x)| - epsilon
+                np.abs(block if part is None else part, out=block)
+                block -= self.epsilon
+            elif part is not None:
+                # 2) Inequalities as-is
+                block[...] = part
+            start += width
 
         # 3) Bounds
-        if self.lower_bound is not None:
-            parts.append(self.lower_bound - genes)
-        if self.upper_bound is not None:
-            parts.append(genes - self.upper_bound)
-
-        if len(parts) == 1:
-            return parts[0]
-        return np.concatenate(parts, axis=1)
+        if not internal:
+            self._write_bounds(genes, out, start)
+        return out
+
+    def _call_callables(self, genes: TwoDArray) -> TwoDArray:
+        """
+        Evaluate only the eq/ineq blocks, as float64 for the native evaluator.
+
+        Algorithms receiving a `Constraints` instance call this from Rust and compute
+        the bound violations natively from `lower_bound` and `upper_bound`.
+
+        The returned array may be the reused internal buffer: the Rust side copies it
+        before the next call.
+        """
+        return self._call_general(genes, internal=True).astype(np.float64, copy=False)
+
+    def __call__(self, genes: TwoDArray) -> TwoDArray:
+        return self._impl(genes)
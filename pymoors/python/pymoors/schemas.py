@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import functools
 from typing import Iterator, List, Union, overload
 
 import numpy as np
 
 from pymoors.typing import OneDArray, TwoDArray
 
+# Array formatter for Individual's str/repr, with its summarization options bound once
+_format_array = functools.partial(
+    np.array2string, threshold=5, edgeitems=3, separator=", "
+)
+
+
+def _all_nonpositive(values: np.ndarray) -> bool:
+    """Whether every value is <= 0, as one reduction with no temporary mask."""
+    # NaN propagates through max and compares False, i.e. infeasible
+    return values.size == 0 or bool(values.max() <= 0)
+
 
 class Individual:
+    # Populations hand out many short-lived individuals: skip the per-instance dict
+    __slots__ = ("genes", "fitness", "rank", "constraints", "survival_score")
+
     def __init__(
         self,
         *,
@@ -33,19 +48,13 @@ class Individual:
     def is_feasible(self) -> bool:
         if self.constraints is None:
             return True
-        return bool(np.all(np.array(self.constraints) <= 0))
+        return _all_nonpositive(np.asarray(self.constraints))
 
     def __str__(self) -> str:
-        genes_str = np.array2string(
-            self.genes, threshold=5, edgeitems=3, separator=", "
-        )
-        fitness_str = np.array2string(
-            self.fitness, threshold=5, edgeitems=3, separator=", "
-        )
+        genes_str = _format_array(self.genes)
+        fitness_str = _format_array(self.fitness)
         constr_str = (
-            np.array2string(self.constraints, threshold=5, edgeitems=3, separator=", ")
-            if self.constraints is not None
-            else None
+            _format_array(self.constraints) if self.constraints is not None else None
         )
 
         return (
@@ -75,11 +84,22 @@ class Population:
         if survival_score is not None and len(survival_score) != len(genes):
             raise ValueError("survival_score must have the same length as genes")
 
-        self.genes = genes
-        self.fitness = fitness
-        self.rank = rank
-        self.survival_score = survival_score
-        self.constraints = constraints
+        # Fixed dtypes and C-contiguous layout, so downstream kernels can rely on them
+        self.genes = np.ascontiguousarray(genes, dtype=np.float64)
+        self.fitness = np.ascontiguousarray(fitness, dtype=np.float64)
+        self.rank = (
+            np.ascontiguousarray(rank, dtype=np.int32) if rank is not None else None
+        )
+        self.survival_score = (
+            np.ascontiguousarray(survival_score, dtype=np.float64)
+            if survival_score is not None
+            else None
+        )
+        self.constraints = (
+            np.ascontiguousarray(constraints, dtype=np.float64)
+            if constraints is not None
+            else None
+        )
         # Set private attribute for whose individuals with rank = 0
         self._best = None
         self._best_as_population = None
@@ -148,10 +168,8 @@ class Population:
     @property
     def best(self) -> List[Individual]:
         if self._best is None:
-            if self.rank is None:
-                self._best = [i for i in self]
-            else:
-                self._best = [i for i in self if i.is_best]
+            # Select the rows on the arrays first, so only best individuals get built
+            self._best = self.best_as_population[:]
         return self._best
 
     @property
@@ -160,18 +178,18 @@ class Population:
             if self.rank is None:
                 self._best_as_population = self
             else:
-                # Create a boolean mask where rank == 0
-                mask = self.rank == 0
-                best_genes = self.genes[mask]
-                best_fitness = self.fitness[mask]
-                best_rank = self.rank[mask]
+                # Indices where rank == 0, computed once and reused for every array
+                idx = np.flatnonzero(self.rank == 0)
+                best_genes = self.genes[idx]
+                best_fitness = self.fitness[idx]
+                best_rank = self.rank[idx]
                 best_survival_score = (
-                    self.survival_score[mask]
+                    self.survival_score[idx]
                     if self.survival_score is not None
                     else None
                 )
                 best_constraints = (
-                    self.constraints[mask] if self.constraints is not None else None
+                    self.constraints[idx] if self.constraints is not None else None
                 )
 
                 self._best_as_population = Population(
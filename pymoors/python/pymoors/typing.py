@@ -9,6 +9,9 @@ OneDArray: TypeAlias = Annotated[npt.NDArray[DType], "ndim=1"]
 TwoDArray: TypeAlias = Annotated[npt.NDArray[DType], "ndim=2"]
 
 FitnessCallable: TypeAlias = Callable[[TwoDArray], TwoDArray]
+# A constraints callable may also set `_out_kwarg = True` and accept an `out=`
+# keyword; `pymoors.Constraints` then writes its result directly into the output
+# buffer (see `Constraints` for the exact protocol).
 ConstraintsCallable: TypeAlias = Callable[[TwoDArray], TwoDArray]
 
 
@@ -1,7 +1,8 @@
 use moors::genetic::{Constraints, Fitness};
 use moors::{ConstraintsFn, FitnessFn, NoConstraints};
-use ndarray::Array2;
+use ndarray::{Array2, Zip, s};
 use numpy::{PyArray1, PyArray2, PyArrayMethods, ToPyArray};
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 
 /// A Python‑backed fitness_fn function for 2D arrays (`Ix2`).
@@ -143,8 +144,105 @@ impl ConstraintsFn for PyConstraints {
     }
 }
 
+/// Constraints whose bound violations are computed natively.
+///
+/// Built from a `pymoors.Constraints` instance. Only its equality/inequality
+/// callables are evaluated in Python, through the optional `callables`
+/// callback returning a 2D array. The bound violations `lower_bound - genes`
+/// and `genes - upper_bound` are written in Rust, so a bounds-only
+/// `pymoors.Constraints` never calls back into Python.
+pub struct NativeConstraints {
+    callables: Option<Py<PyAny>>,
+    lower_bound: Option<f64>,
+    upper_bound: Option<f64>,
+}
+
+impl NativeConstraints {
+    /// Build the evaluator from the attributes of a `pymoors.Constraints` instance.
+    pub fn from_python_constraints(constraints: &Bound<'_, PyAny>) -> PyResult<Self> {
+        let n_callables = constraints.getattr("eq")?.len()? + constraints.getattr("ineq")?.len()?;
+        let callables = if n_callables > 0 {
+            Some(constraints.getattr("_call_callables")?.unbind())
+        } else {
+            None
+        };
+        Ok(Self {
+            callables,
+            lower_bound: constraints.getattr("lower_bound")?.extract()?,
+            upper_bound: constraints.getattr("upper_bound")?.extract()?,
+        })
+    }
+
+    /// Evaluate the callables (if any) and append the bound violations.
+    ///
+    /// The output has the callables columns first, then `lower_bound - genes`
+    /// and `genes - upper_bound`, matching `pymoors.Constraints`.
+    pub fn evaluate(&self, py: Python<'_>, genes: &Array2<f64>) -> PyResult<Array2<f64>> {
+        let (n_rows, n_genes) = genes.dim();
+        let callables_result = match &self.callables {
+            Some(callables) => Some(callables.call1(py, (genes.to_pyarray(py),))?),
+            None => None,
+        };
+        let callables_output = match &callables_result {
+            Some(result) => Some(result.cast_bound::<PyArray2<f64>>(py)?.readonly()),
+            None => None,
+        };
+        let callables_view = callables_output.as_ref().map(|output| output.as_array());
+        let n_callables_cols = match &callables_view {
+            Some(view) if view.nrows() != n_rows => {
+                return Err(PyValueError::new_err(format!(
+                    "Constraint callables returned {} rows, expected {}.",
+                    view.nrows(),
+                    n_rows
+                )));
+            }
+            Some(view) => view.ncols(),
+            None => 0,
+        };
+
+        let n_bounds = self.lower_bound.is_some() as usize + self.upper_bound.is_some() as usize;
+        let mut out = Array2::<f64>::zeros((n_rows, n_callables_cols + n_bounds * n_genes));
+        if let Some(view) = &callables_view {
+            out.slice_mut(s![.., ..n_callables_cols]).assign(view);
+        }
+        let mut start = n_callables_cols;
+        if let Some(lb) = self.lower_bound {
+            Zip::from(out.slice_mut(s![.., start..start + n_genes]))
+                .and(genes)
+                .for_each(|o, &g| *o = lb - g);
+            start += n_genes;
+        }
+        if let Some(ub) = self.upper_bound {
+            Zip::from(out.slice_mut(s![.., start..start + n_genes]))
+                .and(genes)
+                .for_each(|o, &g| *o = g - ub);
+        }
+        Ok(out)
+    }
+}
+
+impl ConstraintsFn for NativeConstraints {
+    type Dim = ndarray::Ix2;
+
+    fn call(&self, genes: &Array2<f64>) -> Constraints<Self::Dim> {
+        Python::attach(|py| {
+            self.evaluate(py, genes)
+                .expect("Failed to evaluate pymoors.Constraints")
+        })
+    }
+
+    fn lower_bound(&self) -> Option<f64> {
+        self.lower_bound
+    }
+
+    fn upper_bound(&self) -> Option<f64> {
+        self.upper_bound
+    }
+}
+
 pub enum PyConstraintsFnWrapper {
     Python(PyConstraints),
+    Native(NativeConstraints),
     None(NoConstraints),
 }
 
@@ -153,6 +251,18 @@ impl PyConstraintsFnWrapper {
         if let Some(py_obj) = pyobj {
             Python::attach(|py| {
                 let any = py_obj.bind(py);
+                // `pymoors.Constraints` only needs Python for its eq/ineq callables.
+                // Subclasses may change how it is evaluated, so they are called as is.
+                let is_constraints = py
+                    .import("pymoors.constraints")
+                    .and_then(|module| module.getattr("Constraints"))
+                    .map(|cls| any.is_exact_instance(&cls))
+                    .unwrap_or(false);
+                if is_constraints {
+                    let native = NativeConstraints::from_python_constraints(any)
+                        .expect("Failed to read pymoors.Constraints attributes");
+                    return PyConstraintsFnWrapper::Native(native);
+                }
                 let lb = any
                     .getattr("lower_bound")
                     .and_then(|v| v.extract::<f64>())
@@ -175,18 +285,21 @@ impl ConstraintsFn for PyConstraintsFnWrapper {
     fn call(&self, genes: &Array2<f64>) -> Constraints<Self::Dim> {
         match self {
             PyConstraintsFnWrapper::Python(w) => w.call(genes),
+            PyConstraintsFnWrapper::Native(n) => n.call(genes),
             PyConstraintsFnWrapper::None(n) => n.call(genes),
         }
     }
     fn lower_bound(&self) -> Option<f64> {
         match self {
             PyConstraintsFnWrapper::Python(w) => w.lower_bound(),
+            PyConstraintsFnWrapper::Native(n) => n.lower_bound(),
             PyConstraintsFnWrapper::None(n) => n.lower_bound(),
         }
     }
     fn upper_bound(&self) -> Option<f64> {
         match self {
             PyConstraintsFnWrapper::Python(w) => w.upper_bound(),
+            PyConstraintsFnWrapper::Native(n) => n.upper_bound(),
             PyConstraintsFnWrapper::None(n) => n.upper_bound(),
         }
     }
@@ -9,34 +9,56 @@ def dummy_fitness(genes: TwoDArray) -> TwoDArray:
 
 
 class CustomBinaryMutation:
-    def __init__(self, gene_mutation_rate: float = 0.5):
+    def __init__(self, gene_mutation_rate: float = 0.5, seed: int | None = None):
         self.gene_mutation_rate = gene_mutation_rate
+        self._rng = np.random.default_rng(seed)
+        self._mask: np.ndarray | None = None
 
     def operate(
         self,
         population: TwoDArray,
     ) -> TwoDArray:
-        mask = np.random.random(population.shape) < self.gene_mutation_rate
-        population[mask] = 1.0 - population[mask]
+        if self._mask is None or self._mask.shape != population.shape:
+            self._mask = np.empty(population.shape, dtype=bool)
+        mask = np.less(
+            self._rng.random(population.shape, dtype=np.float32),
+            self.gene_mutation_rate,
+            out=self._mask,
+        )
+        # Genes are 0.0/1.0, so flipping the masked genes is a logical XOR
+        np.logical_xor(population, mask, out=population)
         return population
 
 
 class CustomBinaryCrossover:
+    # Gene positions per chromosome length, reused across generations
+    _arange_cache: dict[int, np.ndarray] = {}
+
+    def __init__(self, seed: int | None = None):
+        self._rng = np.random.default_rng(seed)
+        self._buf: np.ndarray | None = None
+
     def operate(
         self,
         parents_a: TwoDArray,
         parents_b: TwoDArray,
     ) -> TwoDArray:
         n_pairs, n_genes = parents_a.shape
-        offsprings = np.empty((2 * n_pairs, n_genes), dtype=parents_a.dtype)
-        for i in range(n_pairs):
-            a = parents_a[i]
-            b = parents_b[i]
-            point = np.random.randint(1, n_genes)
-            c1 = np.concatenate((a[:point], b[point:]))
-            c2 = np.concatenate((b[:point], a[point:]))
-            offsprings[2 * i] = c1
-            offsprings[2 * i + 1] = c2
+        points = self._rng.integers(1, n_genes, size=n_pairs)
+        positions = self._arange_cache.get(n_genes)
+        if positions is None:
+            positions = self._arange_cache[n_genes] = np.arange(n_genes)
+        # mask[i, j] is True for the genes taken from the first parent
+        mask = positions[None, :] < points[:, None]
+        # The Rust side copies the result, so the buffer can be reused across calls
+        shape = (2 * n_pairs, n_genes)
+        if self._buf is None or self._buf.shape != shape:
+            self._buf = np.empty(shape, dtype=parents_a.dtype)
+        offsprings = self._buf
+        np.copyto(offsprings[0::2], parents_b)
+        np.copyto(offsprings[0::2], parents_a, where=mask)
+        np.copyto(offsprings[1::2], parents_a)
+        np.copyto(offsprings[1::2], parents_b, where=mask)
         return offsprings
 
 
@@ -56,8 +78,8 @@ class CustomBinarySampling:
 def test_algorithm_with_custom_operators():
     algorithm = Nsga2(
         sampler=CustomBinarySampling(),
-        mutation=CustomBinaryMutation(),
-        crossover=CustomBinaryCrossover(),
+        mutation=CustomBinaryMutation(seed=1),
+        crossover=CustomBinaryCrossover(seed=1),
         fitness_fn=dummy_fitness,
         num_vars=5,
         population_size=100,
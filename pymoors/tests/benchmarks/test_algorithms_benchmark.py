@@ -8,29 +8,17 @@ from pymoors import (
     RandomSamplingFloat,
     SimulatedBinaryCrossover,
 )
-from pymoors.typing import OneDArray, TwoDArray
+from pymoors.typing import TwoDArray
 
 N_VARS: int = 10
 
 
-def f1(x: OneDArray) -> float:
-    """Objective 1."""
-    return sum(xi**2 for xi in x)
-
-
-def f2(x: OneDArray) -> float:
-    """Objective 2"""
-    return sum((xi - 1) ** 2 for xi in x)
-
-
 def fitness_biobjective(population_genes: TwoDArray) -> TwoDArray:
-    population_size = population_genes.shape[0]
-    fitness_fn = np.zeros((population_size, 2), dtype=float)
-    for i in range(population_size):
-        x = population_genes[i]
-        fitness_fn[i, 0] = f1(x)
-        fitness_fn[i, 1] = f2(x)
-    return fitness_fn
+    """Objectives: sum(x_i^2) and sum((x_i - 1)^2), evaluated for the whole population."""
+    shifted = population_genes - 1.0
+    f1 = np.einsum("ij,ij->i", population_genes, population_genes)
+    f2 = np.einsum("ij,ij->i", shifted, shifted)
+    return np.stack((f1, f2), axis=1)
 
 
 def test_small_real_biobjective_nsag2(benchmark):
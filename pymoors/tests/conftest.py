@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+
+def _frozen(values, dtype) -> np.ndarray:
+    # Shared across the whole session, so guard against in-place mutation
+    arr = np.asarray(values, dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+
+@pytest.fixture(scope="session")
+def genes_1d() -> np.ndarray:
+    return _frozen([0.1, 0.2, 0.3], np.float64)
+
+
+@pytest.fixture(scope="session")
+def fitness_1d() -> np.ndarray:
+    return _frozen([0.9, 0.8, 0.7], np.float64)
+
+
+@pytest.fixture(scope="session")
+def constraints_1d() -> np.ndarray:
+    return _frozen([0.0, -0.1, -0.2], np.float64)
+
+
+@pytest.fixture(scope="session")
+def genes_2d() -> np.ndarray:
+    return _frozen([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]], np.float64)
+
+
+@pytest.fixture(scope="session")
+def fitness_2d() -> np.ndarray:
+    return _frozen([[0.9, 0.8], [0.7, 0.6], [0.5, 0.4]], np.float64)
+
+
+@pytest.fixture(scope="session")
+def constraints_2d() -> np.ndarray:
+    return _frozen([[0.0, -0.1], [0.0, 0.1], [-0.2, 0.0]], np.float64)
+
+
+@pytest.fixture(scope="session")
+def rank_3() -> np.ndarray:
+    return _frozen([0, 1, 2], np.int64)
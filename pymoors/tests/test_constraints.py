@@ -1,5 +1,8 @@
 # tests/test_constraints.py
 
+import gc
+import weakref
+
 import numpy as np
 import pytest
 
@@ -191,6 +194,89 @@ def test_eq_list_mixed_1d_2d_with_epsilon():
     np.testing.assert_array_equal(constr(genes), expected)
 
 
+def test_out_kwarg_callables_write_into_output():
+    calls = []
+
+    def ineq_fn(g, out=None):
+        calls.append(out is not None)
+        return np.multiply(g, 2.0, out=out)
+
+    def eq_fn(g, out=None):
+        calls.append(out is not None)
+        return np.subtract(g[:, :1], 1.0, out=out)
+
+    ineq_fn._out_kwarg = True  # type: ignore[attr-defined]
+    eq_fn._out_kwarg = True  # type: ignore[attr-defined]
+
+    eps = 0.1
+    constr = Constraints(eq=eq_fn, ineq=ineq_fn, upper_bound=1.0, epsilon=eps)
+    genes = np.array([[0.5, 2.0], [3.0, -1.0]])
+    expected = np.concatenate(
+        [np.abs(genes[:, :1] - 1.0) - eps, genes * 2.0, genes - 1.0], axis=1
+    )
+    # First call learns the layout, the second one writes through `out=`
+    np.testing.assert_array_equal(constr(genes), expected)
+    np.testing.assert_array_equal(constr(genes), expected)
+    assert calls == [False, False, True, True]
+
+
+def test_out_kwarg_callables_with_1d_output():
+    calls = []
+
+    def ineq_fn(g, out=None):
+        calls.append(out is not None)
+        return np.sum(g, axis=1, out=out)
+
+    def eq_fn(g, out=None):
+        calls.append(out is not None)
+        return np.subtract(g[:, 0], 1.0, out=out)
+
+    ineq_fn._out_kwarg = True  # type: ignore[attr-defined]
+    eq_fn._out_kwarg = True  # type: ignore[attr-defined]
+
+    eps = 0.1
+    constr = Constraints(eq=eq_fn, ineq=ineq_fn, lower_bound=0.0, epsilon=eps)
+    genes = np.array([[0.5, 2.0], [3.0, -1.0]])
+    expected = np.concatenate(
+        [
+            (np.abs(genes[:, 0] - 1.0) - eps).reshape(-1, 1),
+            genes.sum(axis=1).reshape(-1, 1),
+            0.0 - genes,
+        ],
+        axis=1,
+    )
+    # The second call writes the 1D outputs into the (n,) column of each block
+    np.testing.assert_array_equal(constr(genes), expected)
+    np.testing.assert_array_equal(constr(genes), expected)
+    assert calls == [False, False, True, True]
+
+
+def test_out_kwarg_layout_is_relearnt_for_new_genes_width_and_dtype():
+    calls = []
+
+    def ineq_fn(g, out=None):
+        calls.append(out is not None)
+        return np.add(g, 1e-12, out=out)
+
+    ineq_fn._out_kwarg = True  # type: ignore[attr-defined]
+
+    constr = Constraints(ineq=ineq_fn)
+    genes32 = np.ones((2, 2), dtype=np.float32)
+    assert constr(genes32).dtype == np.float32
+
+    # float64 genes must not be written through a float32 layout
+    genes64 = np.ones((2, 2))
+    out = constr(genes64)
+    assert out.dtype == np.float64
+    np.testing.assert_array_equal(out, genes64 + 1e-12)
+
+    # A different number of genes gets a block of the matching width
+    genes_wide = np.ones((2, 3))
+    np.testing.assert_array_equal(constr(genes_wide), genes_wide + 1e-12)
+    np.testing.assert_array_equal(constr(genes_wide), genes_wide + 1e-12)
+    assert calls == [False, False, False, True]
+
+
 # -----------------------
 # Bounds with eq-only / ineq-only
 # -----------------------
@@ -222,6 +308,132 @@ def test_ineq_with_bounds():
     np.testing.assert_array_equal(constr(genes), expected)
 
 
+def test_bounds_promote_integer_genes():
+    constr = Constraints(ineq=lambda g: g, lower_bound=0.5, upper_bound=2)
+    genes = np.array([[0, 1], [2, 3]])
+    out = constr(genes)
+    expected = np.concatenate([genes, 0.5 - genes, genes - 2], axis=1)
+    assert out.dtype == np.float64
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_bounds_keep_float32_genes_dtype():
+    constr = Constraints(lower_bound=np.float64(0.0), upper_bound=1.0)
+    genes = np.array([[0.5, 1.5], [-0.5, 0.25]], dtype=np.float32)
+    out = constr(genes)
+    assert out.dtype == np.float32
+    np.testing.assert_array_equal(out, np.concatenate([0.0 - genes, genes - 1.0], 1))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"lower_bound": 0.0, "upper_bound": 1.0},
+        {"eq": lambda g: g[:, 0], "ineq": lambda g: g, "lower_bound": 0.0},
+    ],
+)
+def test_successive_calls_do_not_alias(kwargs):
+    constr = Constraints(**kwargs)
+    first_genes = np.full((2, 2), 0.5)
+    first = constr(first_genes)
+    expected = first.copy()
+    second = constr(np.full((2, 2), 0.25))
+    assert second is not first
+    assert not np.shares_memory(first, second)
+    np.testing.assert_array_equal(first, expected)
+    np.testing.assert_array_equal(first, constr(first_genes))
+
+
+def test_output_tracks_input_shape():
+    constr = Constraints(lower_bound=0.0, upper_bound=1.0)
+    assert constr(np.full((2, 2), 0.5)).shape == (2, 4)
+    large = constr(np.full((3, 2), 2.0))
+    assert large.shape == (3, 4)
+    np.testing.assert_array_equal(large, np.tile([-2.0, -2.0, 1.0, 1.0], (3, 1)))
+
+
+def test_both_bounds_on_population_spanning_several_tiles():
+    lb, ub = 0.25, 0.75
+    constr = Constraints(lower_bound=lb, upper_bound=ub)
+    genes = np.random.default_rng(0).random((1500, 64))
+    expected = np.concatenate([lb - genes, genes - ub], axis=1)
+    np.testing.assert_array_equal(constr(genes), expected)
+
+
+# -----------------------
+# Native (Rust) evaluator
+# -----------------------
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"lower_bound": -5.0, "upper_bound": -1.0},
+        {"upper_bound": -2.5},
+        {"eq": lambda g: g[:, 0] + 3.0, "ineq": lambda g: g, "lower_bound": -4.0},
+        {"ineq": lambda g: g.sum(axis=1)},
+    ],
+)
+def test_native_evaluator_matches_python_path(kwargs):
+    constraints = Constraints(**kwargs)
+    algorithm = Spea2(
+        sampler=RandomSamplingFloat(min=-5, max=-1),
+        mutation=GaussianMutation(gene_mutation_rate=0.5, sigma=0.01),
+        crossover=ExponentialCrossover(exponential_crossover_rate=0.9),
+        fitness_fn=lambda genes: genes,
+        constraints_fn=constraints,
+        num_vars=2,
+        population_size=5,
+        num_offsprings=5,
+        num_iterations=2,
+        mutation_rate=0.1,
+        crossover_rate=0.9,
+        duplicates_cleaner=None,
+        keep_infeasible=True,
+    )
+    algorithm.run()
+    population = algorithm.population
+    np.testing.assert_allclose(
+        population.constraints, constraints(population.genes), rtol=0, atol=1e-12
+    )
+
+
+def test_constraints_subclass_is_called_from_python():
+    class ScaledConstraints(Constraints):
+        def __call__(self, genes):
+            return 2.0 * super().__call__(genes)
+
+    constraints = ScaledConstraints(ineq=lambda g: g, lower_bound=-5.0)
+    algorithm = Spea2(
+        sampler=RandomSamplingFloat(min=-5, max=-1),
+        mutation=GaussianMutation(gene_mutation_rate=0.5, sigma=0.01),
+        crossover=ExponentialCrossover(exponential_crossover_rate=0.9),
+        fitness_fn=lambda genes: genes,
+        constraints_fn=constraints,
+        num_vars=2,
+        population_size=5,
+        num_offsprings=5,
+        num_iterations=2,
+        mutation_rate=0.1,
+        crossover_rate=0.9,
+        duplicates_cleaner=None,
+        keep_infeasible=True,
+    )
+    algorithm.run()
+    population = algorithm.population
+    # The overridden __call__ is used, not the native evaluator
+    np.testing.assert_array_equal(population.constraints, constraints(population.genes))
+
+
+def test_constraints_with_callables_are_garbage_collected():
+    constraints = Constraints(ineq=lambda g: g, lower_bound=0.0)
+    constraints(np.ones((2, 2)))
+    ref = weakref.ref(constraints)
+    del constraints
+    gc.collect()
+    assert ref() is None
+
+
 # -----------------------
 # Integration with algorithm
 # -----------------------
@@ -4,13 +4,9 @@ import pytest
 from pymoors.schemas import Individual, Population
 
 
-def test_individual_is_best():
-    genes = np.array([0.1, 0.2, 0.3])
-    fitness = np.array([0.9, 0.8, 0.7])
-    constraints = np.array([0.0, -0.1, -0.2])
-
+def test_individual_is_best(genes_1d, fitness_1d, constraints_1d):
     individual = Individual(
-        genes=genes, fitness=fitness, rank=0, constraints=constraints
+        genes=genes_1d, fitness=fitness_1d, rank=0, constraints=constraints_1d
     )
     assert individual.is_best
     assert (
@@ -61,20 +57,22 @@ def test_individual_str_repr_large_arrays():
     )
 
 
-def test_individual_is_feasible():
-    genes = np.array([0.1, 0.2, 0.3])
-    fitness = np.array([0.9, 0.8, 0.7])
-    constraints = np.array([0.0, -0.1, -0.2])
-
+def test_individual_is_feasible(genes_1d, fitness_1d, constraints_1d):
     # Feasible constraints
     individual = Individual(
-        genes=genes, fitness=fitness, rank=0, constraints=constraints
+        genes=genes_1d, fitness=fitness_1d, rank=0, constraints=constraints_1d
     )
     assert individual.is_feasible
 
     # Infeasible constraints
     individual.constraints = np.array([0.0, 0.1, -0.2])
     assert not individual.is_feasible
+    individual.constraints = np.array([np.nan, -0.1, -0.2])
+    assert not individual.is_feasible
+
+    # Empty constraints are trivially satisfied
+    individual.constraints = np.array([])
+    assert individual.is_feasible
 
     # No constraints --- Also check that str/repr properly set constraints to None
     individual.constraints = None
@@ -92,13 +90,10 @@ def test_individual_is_feasible():
     )
 
 
-def test_population_length():
-    genes = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
-    fitness = np.array([[0.5, 0.4], [0.7, 0.6], [0.8, 0.9]])
-    rank = np.array([0, 1, 2])
-    constraints = np.array([[0.0, -0.1], [0.0, 0.1], [-0.2, 0.0]])
-
-    pop = Population(genes=genes, fitness=fitness, rank=rank, constraints=constraints)
+def test_population_length(genes_2d, fitness_2d, rank_3, constraints_2d):
+    pop = Population(
+        genes=genes_2d, fitness=fitness_2d, rank=rank_3, constraints=constraints_2d
+    )
     assert len(pop) == 3
     assert (
         str(pop)
@@ -107,60 +102,58 @@ def test_population_length():
     )
 
 
-def test_population_best():
-    genes = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
-    fitness = np.array(
-        [
-            [0.5, 0.4],
-            [0.4, 0.5],
-            [0.7, 0.6],
-        ]
+def test_population_normalizes_dtypes_and_layout(genes_2d, fitness_2d):
+    genes = np.asfortranarray(genes_2d.astype(np.float32))
+    pop = Population(
+        genes=genes,
+        fitness=fitness_2d[::-1],
+        rank=np.array([0, 1, 2], dtype=np.int64),
+        constraints=np.array([[0, -1], [0, 1], [-2, 0]]),
     )
+    for arr in (pop.genes, pop.fitness, pop.constraints):
+        assert arr.dtype == np.float64  # type: ignore[union-attr]
+        assert arr.flags["C_CONTIGUOUS"]  # type: ignore[union-attr]
+    assert pop.rank.dtype == np.int32  # type: ignore[union-attr]
+    np.testing.assert_array_equal(pop.genes, genes)
+    np.testing.assert_array_equal(pop.fitness, fitness_2d[::-1])
+
+
+def test_population_best(genes_2d, fitness_2d):
     rank = np.array([0, 0, 1])
 
-    pop = Population(genes=genes, fitness=fitness, rank=rank)
+    pop = Population(genes=genes_2d, fitness=fitness_2d, rank=rank)
     assert len(pop.best) == 2
+    assert all(individual.is_best for individual in pop.best)
     assert len(pop.best_as_population) == 2
     assert isinstance(pop.best_as_population, Population)
+    np.testing.assert_array_equal(pop.best_as_population.genes, genes_2d[:2])
 
 
-def test_population_best_no_rank():
+def test_population_best_no_rank(genes_2d, fitness_2d):
     # W.O rank every individual is considered best (for now)
-    genes = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
-    fitness = np.array(
-        [
-            [0.5, 0.4],
-            [0.4, 0.5],
-            [0.7, 0.6],
-        ]
-    )
-
-    pop = Population(genes=genes, fitness=fitness)
+    pop = Population(genes=genes_2d, fitness=fitness_2d)
     assert len(pop.best) == 3
     assert len(pop.best_as_population) == 3
     assert isinstance(pop.best_as_population, Population)
 
 
-def test_population_getitem():
-    genes = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
-    fitness = np.array([[0.9, 0.8], [0.7, 0.6], [0.5, 0.4]])
-    rank = np.array([0, 1, 2])
-    constraints = np.array([[0.0, -0.1], [0.0, 0.1], [-0.2, 0.0]])
-
-    pop = Population(genes=genes, fitness=fitness, rank=rank, constraints=constraints)
+def test_population_getitem(genes_2d, fitness_2d, rank_3, constraints_2d):
+    pop = Population(
+        genes=genes_2d, fitness=fitness_2d, rank=rank_3, constraints=constraints_2d
+    )
 
     # Test single indexing
     individual = pop[0]
-    assert np.array_equal(individual.genes, genes[0])
-    assert np.array_equal(individual.fitness, fitness[0])
-    assert individual.rank == rank[0]
-    assert np.array_equal(individual.constraints, constraints[0])  # type: ignore
+    np.testing.assert_array_equal(individual.genes, genes_2d[0])
+    np.testing.assert_array_equal(individual.fitness, fitness_2d[0])
+    assert individual.rank == rank_3[0]
+    np.testing.assert_array_equal(individual.constraints, constraints_2d[0])  # type: ignore
 
     # Test slicing
     individuals = pop[1:3]
     assert len(individuals) == 2
-    assert np.array_equal(individuals[0].genes, genes[1])
-    assert np.array_equal(individuals[1].genes, genes[2])
+    np.testing.assert_array_equal(individuals[0].genes, genes_2d[1])
+    np.testing.assert_array_equal(individuals[1].genes, genes_2d[2])
 
     # Test Incorrect get item
     with pytest.raises(
@@ -169,34 +162,38 @@ def test_population_getitem():
         _ = pop[[1, 2, 3]]  # type: ignore
 
 
-def test_population_raises_value_error_for_length_mismatch():
-    genes = np.array([[0.1, 0.2], [0.3, 0.4]])
-    fitness = np.array([[0.9, 0.8], [0.7, 0.6], [0.5, 0.4]])
-    rank = np.array([0, 1])
-    constraints = np.array([[0.0, -0.1], [0.0, 0.1]])
-
-    with pytest.raises(
-        ValueError, match="genes and fitness arrays must have the same lenght"
-    ):
-        Population(genes=genes, fitness=fitness, rank=rank, constraints=constraints)
-
-
-def test_population_raises_value_error_for_constraints_mismatch():
-    genes = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
-    fitness = np.array([[0.9, 0.8], [0.7, 0.6], [0.5, 0.4]])
-    rank = np.array([0, 1, 2])
-    constraints = np.array([[0.0, -0.1]])
-
-    with pytest.raises(
-        ValueError, match="constraints must have the same length as genes"
-    ):
-        Population(genes=genes, fitness=fitness, rank=rank, constraints=constraints)
-
-
-def test_population_raises_value_error_for_rank_mismatch():
-    genes = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
-    fitness = np.array([[0.9, 0.8], [0.7, 0.6], [0.5, 0.4]])
-    rank = np.array([0, 1, 2, 3])
-
-    with pytest.raises(ValueError, match="rank must have the same length as genes"):
-        Population(genes=genes, fitness=fitness, rank=rank)
+@pytest.mark.parametrize(
+    "field, values, match",
+    [
+        (
+            "genes",
+            ((0.1, 0.2), (0.3, 0.4)),
+            "genes and fitness arrays must have the same lenght",
+        ),
+        (
+            "constraints",
+            ((0.0, -0.1),),
+            "constraints must have the same length as genes",
+        ),
+        ("rank", (0, 1, 2, 3), "rank must have the same length as genes"),
+        (
+            "survival_score",
+            (0.1, 0.2),
+            "survival_score must have the same length as genes",
+        ),
+    ],
+    ids=["length", "constraints", "rank", "survival_score"],
+)
+def test_population_raises_value_error_for_mismatch(
+    field, values, match, genes_2d, fitness_2d, rank_3, constraints_2d
+):
+    kwargs = {
+        "genes": genes_2d,
+        "fitness": fitness_2d,
+        "rank": rank_3,
+        "constraints": constraints_2d,
+    }
+    kwargs[field] = np.asarray(values)
+
+    with pytest.raises(ValueError, match=match):
+        Population(**kwargs)